@@ -605,7 +605,9 @@ clean_status() {
         if [[ "$DRY_RUN" == "true" ]]; then
             print_item "status" "$name" "$size_human"
         else
-            rm -f "$status_file"
+            # Also reap companion artifacts: the .tmp from an interrupted
+            # atomic write and the .mmap seqlock region (KAPSIS_STATUS_MMAP)
+            rm -f "$status_file" "${status_file}.tmp" "${status_file}.mmap"
             print_item "status" "$name" "$size_human"
         fi
 
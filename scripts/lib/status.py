@@ -19,21 +19,172 @@ Environment Variables (set by Kapsis container):
     KAPSIS_STATUS_AGENT_ID - Agent ID
     KAPSIS_STATUS_BRANCH   - Git branch (optional)
     KAPSIS_SANDBOX_MODE    - Sandbox mode (worktree/overlay)
+    KAPSIS_STATUS_PRETTY   - Set to 1 for indented status JSON (debugging)
+    KAPSIS_STATUS_MMAP     - Set to 1 to publish status via a mmap seqlock
+                             region (experimental); the .json file is still
+                             refreshed at a low rate for existing readers
 """
 
+import atexit
 import json
+import mmap
 import os
+import re
+import struct
+import threading
 import time
-from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
 from typing import Optional
 
-# Phase names for semantic status tracking
-PHASES = ["exploring", "implementing", "building", "testing", "committing", "completing"]
+# orjson serializes straight to bytes in C and is noticeably cheaper than
+# stdlib json's pure-Python indenting encoder. It is optional — containers
+# built from the minimal profile may not have it, so fall back to stdlib.
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# os.writev gather-writes payload + trailing newline in one syscall without
+# concatenating the bytes first; not available on Windows
+_HAS_WRITEV = hasattr(os, "writev")
+
+# Phase names for semantic status tracking (ordered for documentation;
+# the frozenset below is what update() uses for O(1) membership checks)
+PHASES = ("exploring", "implementing", "building", "testing", "committing", "completing")
+_PHASES_SET = frozenset(PHASES)
+
+# Progress clamp bounds for the running phase
+_RUNNING_PROGRESS_MIN = 25
+_RUNNING_PROGRESS_MAX = 90
 
 # Default status directory inside container
 DEFAULT_STATUS_DIR = "/kapsis-status"
 
+# How long (seconds) an unchanged status may be skipped before we rewrite it
+# anyway. The host liveness monitor judges agent health by timestamp
+# staleness, so identical updates must still refresh the file periodically.
+_UNCHANGED_REFRESH_SECONDS = 5.0
+
+# Precompiled keyword patterns for classifying Bash commands. A single
+# compiled scan of the command replaces per-call keyword lists and the
+# Python-level `any(... in ...)` substring loops.
+# mvnw/gradlew/pnpm matter: wrapper invocations are the canonical build
+# command for the Maven/Gradle projects this sandbox targets, and \b would
+# otherwise exclude them (w is a word character; same for the p in pnpm).
+# The generic test token tolerates _ and the plural so runner scripts like
+# ./run_tests.sh still classify, without matching inside words like "latest".
+_BUILD_RE = re.compile(r"\b(mvnw?|maven|gradlew?|pnpm|npm|yarn|cargo|cmake|make|go build)\b")
+_TEST_RE = re.compile(r"\b(pytest|unittest|ctest|jest|mocha|rspec|cargo test)\b|(?:\b|_)tests?(?:\b|_)")
+_COMMIT_RE = re.compile(r"git commit")
+
+class _Cat(IntEnum):
+    """Tool categories as array indices — hot counters live in a plain list."""
+
+    EXPLORE = 0
+    IMPLEMENT = 1
+    BUILD = 2
+    TEST = 3
+    COMMIT = 4
+
+
+# Direct tool-name → category dispatch (lowercased names). One hash lookup
+# replaces the per-call list allocations and linear membership scans; only
+# "bash" needs further command analysis.
+_TOOL_CATEGORY = {
+    "read": _Cat.EXPLORE,
+    "grep": _Cat.EXPLORE,
+    "glob": _Cat.EXPLORE,
+    "search": _Cat.EXPLORE,
+    "find": _Cat.EXPLORE,
+    "write": _Cat.IMPLEMENT,
+    "edit": _Cat.IMPLEMENT,
+    "notebookedit": _Cat.IMPLEMENT,
+}
+
+# Progress weights per tool category, indexed by _Cat (later categories =
+# more progress). Each category saturates after _WEIGHT_SATURATION uses.
+_WEIGHTS = (0.15, 0.35, 0.20, 0.20, 0.10)
+_WEIGHT_SATURATION = 10
+
+# Minimum interval (seconds) between status file flushes. The host poller
+# reads at ~1 Hz, so writing on every tool call (50+/sec for fast agents)
+# is wasted I/O — updates are coalesced and only the latest one is written.
+_DEBOUNCE_SECONDS = 0.25
+
+# Snapshot the KAPSIS_* environment once at import. The container sets these
+# before the agent starts and never changes them, so per-instance
+# os.environ.get calls are wasted work for short-lived agents that construct
+# KapsisStatus repeatedly. Tests can call refresh_env() after monkeypatching.
+_DEFAULT_PROJECT = os.environ.get("KAPSIS_STATUS_PROJECT", "unknown")
+_DEFAULT_AGENT_ID = os.environ.get("KAPSIS_STATUS_AGENT_ID", "0")
+_DEFAULT_BRANCH = os.environ.get("KAPSIS_STATUS_BRANCH", "")
+_DEFAULT_SANDBOX_MODE = os.environ.get("KAPSIS_SANDBOX_MODE", "overlay")
+_DEFAULT_STATUS_DIR = os.environ.get("KAPSIS_STATUS_DIR", DEFAULT_STATUS_DIR)
+
+# The status file is machine-read by the host, so compact JSON is the
+# default — indent=2 roughly doubles the bytes written and forces stdlib
+# json down its pure-Python indenting encoder. Opt in for debugging.
+_PRETTY = os.environ.get("KAPSIS_STATUS_PRETTY") == "1"
+
+# Experimental: publish status through a fixed-size mmap region instead of
+# temp-file+rename, avoiding all per-update syscalls. Opt-in only — the
+# default rename-based file stays the compatible transport.
+_USE_MMAP = os.environ.get("KAPSIS_STATUS_MMAP") == "1"
+
+# In mmap mode the .json file is still refreshed at this interval (and for
+# every terminal write) so the existing readers — kapsis-status.sh, the
+# liveness monitor, the dashboard — keep working without region support.
+_MMAP_JSON_REFRESH_SECONDS = 2.0
+
+# Layout of the 8 KiB region (<project>-<id>.json.mmap): a 64-byte header
+# followed by two payload slots. The single writer bumps the sequence to odd,
+# fills the inactive slot, publishes slot index + payload length, then bumps
+# the sequence to even. Readers snapshot the sequence before and after
+# copying the active slot and retry if it was odd or changed (seqlock).
+#   offset 0:  8s  magic "KAPSTAT1"
+#   offset 8:  Q   sequence counter (odd = write in progress)
+#   offset 16: I   active slot index (0 or 1)
+#   offset 20: I   payload length in the active slot
+_MMAP_MAGIC = b"KAPSTAT1"
+_MMAP_SIZE = 8192
+_MMAP_HEADER_SIZE = 64
+_MMAP_SLOT_SIZE = (_MMAP_SIZE - _MMAP_HEADER_SIZE) // 2
+_MMAP_SEQ = struct.Struct("<Q")
+_MMAP_SLOT_INFO = struct.Struct("<II")
+_MMAP_SEQ_OFFSET = 8
+_MMAP_SLOT_INFO_OFFSET = 16
+
+
+def _noop() -> None:
+    """Replacement for per-instance methods that have nothing left to do."""
+
+
+def _basename(path: str) -> str:
+    """Final path component via string ops — no Path allocation (handles / and \\)."""
+    i = max(path.rfind("/"), path.rfind("\\"))
+    return path[i + 1:]
+
+
+def refresh_env() -> None:
+    """Re-read the KAPSIS_* environment snapshot and rebuild the default
+    status instance from it (for tests)."""
+    global _DEFAULT_PROJECT, _DEFAULT_AGENT_ID, _DEFAULT_BRANCH
+    global _DEFAULT_SANDBOX_MODE, _DEFAULT_STATUS_DIR, _PRETTY, _USE_MMAP
+    _DEFAULT_PROJECT = os.environ.get("KAPSIS_STATUS_PROJECT", "unknown")
+    _DEFAULT_AGENT_ID = os.environ.get("KAPSIS_STATUS_AGENT_ID", "0")
+    _DEFAULT_BRANCH = os.environ.get("KAPSIS_STATUS_BRANCH", "")
+    _DEFAULT_SANDBOX_MODE = os.environ.get("KAPSIS_SANDBOX_MODE", "overlay")
+    _DEFAULT_STATUS_DIR = os.environ.get("KAPSIS_STATUS_DIR", DEFAULT_STATUS_DIR)
+    _PRETTY = os.environ.get("KAPSIS_STATUS_PRETTY") == "1"
+    _USE_MMAP = os.environ.get("KAPSIS_STATUS_MMAP") == "1"
+    # The eager singleton was built from the import-time snapshot; rebuild it
+    # so get_status() and the convenience functions see the new values
+    global _default_status
+    _default_status = KapsisStatus()
+
 
 class KapsisStatus:
     """
@@ -60,11 +211,11 @@ class KapsisStatus:
             sandbox_mode: Sandbox mode (defaults to KAPSIS_SANDBOX_MODE env var)
             status_dir: Status directory (defaults to /kapsis-status)
         """
-        self.project = project or os.environ.get("KAPSIS_STATUS_PROJECT", "unknown")
-        self.agent_id = agent_id or os.environ.get("KAPSIS_STATUS_AGENT_ID", "0")
-        self.branch = branch or os.environ.get("KAPSIS_STATUS_BRANCH", "")
-        self.sandbox_mode = sandbox_mode or os.environ.get("KAPSIS_SANDBOX_MODE", "overlay")
-        self.status_dir = Path(status_dir or os.environ.get("KAPSIS_STATUS_DIR", DEFAULT_STATUS_DIR))
+        self.project = project or _DEFAULT_PROJECT
+        self.agent_id = agent_id or _DEFAULT_AGENT_ID
+        self.branch = branch or _DEFAULT_BRANCH
+        self.sandbox_mode = sandbox_mode or _DEFAULT_SANDBOX_MODE
+        self.status_dir = Path(status_dir or _DEFAULT_STATUS_DIR)
 
         # Status file path
         self.status_file = self.status_dir / f"kapsis-{self.project}-{self.agent_id}.json"
@@ -72,29 +223,126 @@ class KapsisStatus:
         # State file for tracking
         self.state_file = self.status_dir / f".state-{self.project}-{self.agent_id}"
 
-        # Track tool usage for progress estimation
-        self.tool_counts = {
-            "explore": 0,
-            "implement": 0,
-            "build": 0,
-            "test": 0,
-            "commit": 0,
+        # Plain-string paths for the write path — avoids rebuilding Path
+        # objects (with_suffix + str conversion) on every status flush
+        self._status_path_str = str(self.status_file)
+        self._tmp_path_str = self._status_path_str + ".tmp"
+
+        # Lazily-mapped seqlock region (only used with KAPSIS_STATUS_MMAP=1)
+        self._mmap_path_str = self._status_path_str + ".mmap"
+        self._mmap: Optional[mmap.mmap] = None
+        self._mmap_failed = False
+        self._last_json_write_time = 0.0
+
+        # Reusable status payload: the identity fields never change after
+        # construction, so each write only mutates phase/progress/message/
+        # timestamp instead of rebuilding the whole dict
+        self._status_data = {
+            "phase": "",
+            "progress": 0,
+            "message": "",
+            "timestamp": "",
+            "project": self.project,
+            "agent_id": self.agent_id,
+            "branch": self.branch,
+            "sandbox_mode": self.sandbox_mode,
         }
 
-        # Initialize status
-        self._initialized = False
+        # Track tool usage for progress estimation, indexed by _Cat
+        self.tool_counts = [0] * len(_Cat)
+
+        # Running weighted totals, maintained incrementally by record_tool so
+        # calculate_progress is O(1) instead of re-iterating every category
+        self._weighted_sum = 0.0
+        self._weighted_total = 0.0
+
+        # Last write, for skipping redundant rewrites of identical status
+        self._last_write_key: Optional[tuple] = None
+        self._last_write_time = 0.0
+
+        # Per-second cache of the formatted timestamp — updates within the
+        # same second reuse the strftime result and only refresh microseconds
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+
+        # Serialized payload split around the timestamp value: when only the
+        # timestamp changes (periodic refresh of an unchanged status), the
+        # new payload is spliced from these instead of re-running the encoder
+        self._ser_key: Optional[tuple] = None
+        self._ser_prefix = b""
+        self._ser_suffix = b""
+
+        # Debounced writer state: update() stores the latest status here and
+        # a daemon thread flushes it to disk at most every _DEBOUNCE_SECONDS.
+        self._pending: Optional[tuple] = None
+        self._pending_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+
+        # _write_status runs on both the writer thread and the caller's
+        # thread (complete/fail/atexit); the lock serializes them, and the
+        # final flag keeps a late daemon flush from overwriting the terminal
+        # status after complete()/fail() has been written.
+        self._write_lock = threading.Lock()
+        self._final = False
 
     def _ensure_initialized(self) -> None:
-        """Ensure status directory exists and is writable."""
-        if self._initialized:
-            return
+        """Ensure status directory exists and is writable.
 
+        On success the instance attribute is rebound to a module-level no-op,
+        so subsequent writes pay neither the branch nor the mkdir attempt;
+        failures leave the method in place so the next write retries.
+        """
         try:
             self.status_dir.mkdir(parents=True, exist_ok=True)
-            self._initialized = True
+            self._ensure_initialized = _noop
         except (OSError, PermissionError) as e:
             print(f"Warning: Cannot create status directory {self.status_dir}: {e}")
 
+    def _mmap_open(self) -> Optional[mmap.mmap]:
+        """Map the fixed-size seqlock region, creating it on first use."""
+        if self._mmap is None and not self._mmap_failed:
+            try:
+                fd = os.open(self._mmap_path_str, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    os.ftruncate(fd, _MMAP_SIZE)
+                    self._mmap = mmap.mmap(fd, _MMAP_SIZE)
+                finally:
+                    os.close(fd)
+                # Reset the header: the file may survive a previous run and
+                # its stale sequence/slot bytes must not be trusted
+                self._mmap[:_MMAP_HEADER_SIZE] = b"\x00" * _MMAP_HEADER_SIZE
+                self._mmap[: len(_MMAP_MAGIC)] = _MMAP_MAGIC
+            except (OSError, ValueError) as e:
+                self._mmap_failed = True
+                print(f"Warning: Cannot map status region {self._mmap_path_str}: {e}")
+        return self._mmap
+
+    def _mmap_write(self, payload: bytes) -> bool:
+        """
+        Publish a payload into the seqlock region without any syscalls.
+
+        Returns False (caller falls back to temp-file+rename) if the region
+        cannot be mapped or the payload exceeds the slot size.
+        """
+        if len(payload) > _MMAP_SLOT_SIZE:
+            return False
+        region = self._mmap_open()
+        if region is None:
+            return False
+
+        (seq,) = _MMAP_SEQ.unpack_from(region, _MMAP_SEQ_OFFSET)
+        active, _ = _MMAP_SLOT_INFO.unpack_from(region, _MMAP_SLOT_INFO_OFFSET)
+        target = 0 if active else 1
+
+        # seqlock write: odd sequence marks the write in progress
+        _MMAP_SEQ.pack_into(region, _MMAP_SEQ_OFFSET, seq + 1)
+        start = _MMAP_HEADER_SIZE + target * _MMAP_SLOT_SIZE
+        region[start : start + len(payload)] = payload
+        _MMAP_SLOT_INFO.pack_into(region, _MMAP_SLOT_INFO_OFFSET, target, len(payload))
+        _MMAP_SEQ.pack_into(region, _MMAP_SEQ_OFFSET, seq + 2)
+        return True
+
     def _write_status(
         self,
         phase: str,
@@ -114,53 +362,168 @@ class KapsisStatus:
         Returns:
             True if write succeeded, False otherwise
         """
+        # The debounced daemon thread and direct callers (complete/fail and
+        # the atexit hook) can race here; the lock serializes access to the
+        # shared write state (payload dict, serializer cache, temp path).
+        with self._write_lock:
+            if self._final and exit_code is None:
+                # A flush that lost the race to complete()/fail() must not
+                # clobber the terminal status with a stale running update
+                return True
+            return self._write_status_locked(phase, progress, message, exit_code)
+
+    def _write_status_locked(
+        self,
+        phase: str,
+        progress: int,
+        message: str,
+        exit_code: Optional[int] = None,
+    ) -> bool:
+        """Body of _write_status; caller must hold _write_lock."""
         self._ensure_initialized()
 
-        status_data = {
-            "phase": phase,
-            "progress": max(0, min(100, progress)),
-            "message": message,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "project": self.project,
-            "agent_id": self.agent_id,
-            "branch": self.branch,
-            "sandbox_mode": self.sandbox_mode,
-        }
+        # Bursty tool-use loops produce long runs of identical updates
+        # (timestamp aside); skip the temp-file/rename dance for those, but
+        # still rewrite periodically so the host sees a fresh timestamp.
+        now = time.time()
+        write_key = (phase, progress, message, exit_code)
+        if (
+            write_key == self._last_write_key
+            and now - self._last_write_time < _UNCHANGED_REFRESH_SECONDS
+        ):
+            return True
 
-        if exit_code is not None:
-            status_data["exit_code"] = exit_code
+        # Format the UTC timestamp without a datetime allocation; the
+        # seconds part is cached since it rarely changes between writes
+        sec = int(now)
+        if sec != self._last_ts_sec:
+            self._last_ts_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._last_ts_sec = sec
+        timestamp = f"{self._last_ts_str}.{int((now - sec) * 1e6):06d}Z"
+
+        if write_key == self._ser_key:
+            # Only the timestamp changed since the last serialization —
+            # splice it into the cached payload, skipping the JSON encoder
+            payload = self._ser_prefix + timestamp.encode("ascii") + self._ser_suffix
+        else:
+            status_data = self._status_data
+            status_data["phase"] = phase
+            status_data["progress"] = max(0, min(100, progress))
+            status_data["message"] = message
+            status_data["timestamp"] = timestamp
+
+            if exit_code is not None:
+                status_data["exit_code"] = exit_code
+            else:
+                status_data.pop("exit_code", None)
+
+            if _HAS_ORJSON:
+                payload = orjson.dumps(
+                    status_data, option=orjson.OPT_INDENT_2 if _PRETTY else 0
+                )
+            elif _PRETTY:
+                payload = json.dumps(status_data, indent=2).encode("utf-8")
+            else:
+                payload = json.dumps(status_data, separators=(",", ":")).encode("utf-8")
+
+            # Cache the payload split around the timestamp value for the
+            # splice fast path. The quoted key cannot occur inside a JSON
+            # string value (quotes are escaped there), so find() is safe.
+            idx = payload.find(b'"timestamp"')
+            start = payload.index(b'"', idx + 11) + 1
+            end = payload.index(b'"', start)
+            self._ser_key = write_key
+            self._ser_prefix = payload[:start]
+            self._ser_suffix = payload[end:]
+
+        if _USE_MMAP and self._mmap_write(payload):
+            self._last_write_key = write_key
+            self._last_write_time = now
+            # The region has no in-tree reader yet: keep the .json fresh at
+            # a low rate (and always for terminal status) so kapsis-status,
+            # the liveness monitor, and the dashboard still see updates
+            if exit_code is None and now - self._last_json_write_time < _MMAP_JSON_REFRESH_SECONDS:
+                return True
 
         try:
-            # Write atomically using temp file
-            temp_file = self.status_file.with_suffix(".tmp")
-            temp_file.write_text(json.dumps(status_data, indent=2) + "\n")
-            temp_file.rename(self.status_file)
+            # Write atomically: single write to a temp file, then atomic replace
+            fd = os.open(self._tmp_path_str, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                if _HAS_WRITEV:
+                    os.writev(fd, [payload, b"\n"])
+                else:
+                    os.write(fd, payload + b"\n")
+            finally:
+                os.close(fd)
+            os.replace(self._tmp_path_str, self._status_path_str)
+            self._last_write_key = write_key
+            self._last_write_time = now
+            self._last_json_write_time = now
             return True
         except (OSError, PermissionError) as e:
             print(f"Warning: Cannot write status file: {e}")
             return False
 
+    def _queue_write(self, phase: str, progress: int, message: str) -> bool:
+        """
+        Queue a status write for the debounced writer thread.
+
+        Only the most recent status is kept; the daemon thread flushes it to
+        disk at most every _DEBOUNCE_SECONDS. An atexit hook flushes whatever
+        is still pending so the final status is never lost.
+        """
+        with self._pending_lock:
+            self._pending = (phase, progress, message)
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="kapsis-status-writer", daemon=True
+                )
+                self._writer_thread.start()
+                atexit.register(self._flush_pending)
+        self._flush_event.set()
+        return True
+
+    def _writer_loop(self) -> None:
+        """Daemon thread: coalesce bursts of updates into periodic flushes."""
+        while True:
+            self._flush_event.wait()
+            self._flush_event.clear()
+            # Let a burst of updates accumulate; only the latest one matters
+            time.sleep(_DEBOUNCE_SECONDS)
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Write the most recent queued status, if any."""
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = None
+        if pending is not None:
+            self._write_status(*pending)
+
     def update(self, phase: str, progress: int, message: str) -> bool:
         """
         Update status with current phase and progress.
 
+        Writes are coalesced: bursts of updates are flushed to disk at most
+        every _DEBOUNCE_SECONDS by a background thread.
+
         Args:
             phase: Current phase (exploring, implementing, building, testing, committing)
             progress: Progress percentage (25-90 for running phase)
             message: Description of current activity
 
         Returns:
-            True if update succeeded
+            True if the update was accepted
         """
         # Validate phase
-        if phase not in PHASES:
+        if phase not in _PHASES_SET:
             print(f"Warning: Unknown phase '{phase}', using 'implementing'")
             phase = "implementing"
 
         # Clamp progress to running range (25-90)
-        progress = max(25, min(90, progress))
+        progress = max(_RUNNING_PROGRESS_MIN, min(_RUNNING_PROGRESS_MAX, progress))
 
-        return self._write_status(phase, progress, message)
+        return self._queue_write(phase, progress, message)
 
     def record_tool(self, tool_name: str, command: str = "", file_path: str = "") -> None:
         """
@@ -173,40 +536,45 @@ class KapsisStatus:
         """
         # Map tool to category
         category = self._map_tool_to_category(tool_name, command)
-        if category in self.tool_counts:
-            self.tool_counts[category] += 1
-
-    def _map_tool_to_category(self, tool_name: str, command: str = "") -> str:
-        """Map tool name to progress category."""
-        tool_lower = tool_name.lower()
-
-        # Exploring tools
-        if tool_lower in ["read", "grep", "glob", "search", "find"]:
-            return "explore"
-
-        # Implementation tools
-        if tool_lower in ["write", "edit", "notebookedit"]:
-            return "implement"
+        prev_count = self.tool_counts[category]
+        self.tool_counts[category] = prev_count + 1
+        # Keep the weighted totals in sync (diminishing returns: each
+        # category stops contributing after _WEIGHT_SATURATION uses)
+        if prev_count < _WEIGHT_SATURATION:
+            weight = _WEIGHTS[category]
+            self._weighted_sum += weight / _WEIGHT_SATURATION
+            if prev_count == 0:
+                self._weighted_total += weight
+
+    def _map_tool_to_category(self, tool_name: str, command: str = "") -> int:
+        """Map tool name to a _Cat progress category index."""
+        # islower() is a C-level scan; skipping .lower() avoids copying the
+        # string when it is already lowercase (the common case for commands)
+        tool_lower = tool_name if tool_name.islower() else tool_name.lower()
+
+        category = _TOOL_CATEGORY.get(tool_lower)
+        if category is not None:
+            return category
 
         # Bash commands need further analysis
         if tool_lower == "bash":
-            cmd_lower = command.lower()
+            cmd_lower = command if command.islower() else command.lower()
 
             # Build commands
-            if any(b in cmd_lower for b in ["mvn", "maven", "gradle", "npm", "yarn", "cargo", "make", "go build"]):
-                return "build"
+            if _BUILD_RE.search(cmd_lower):
+                return _Cat.BUILD
 
             # Test commands
-            if any(t in cmd_lower for t in ["test", "pytest", "jest", "mocha", "rspec", "cargo test"]):
-                return "test"
+            if _TEST_RE.search(cmd_lower):
+                return _Cat.TEST
 
             # Git commit
-            if "git commit" in cmd_lower:
-                return "commit"
+            if _COMMIT_RE.search(cmd_lower):
+                return _Cat.COMMIT
 
-            return "implement"
+            return _Cat.IMPLEMENT
 
-        return "implement"
+        return _Cat.IMPLEMENT
 
     def calculate_progress(self) -> int:
         """
@@ -215,36 +583,11 @@ class KapsisStatus:
         Returns:
             Progress percentage (25-90)
         """
-        total = sum(self.tool_counts.values())
-        if total == 0:
-            return 25
-
-        # Weight by category (later categories = more progress)
-        weights = {
-            "explore": 0.15,
-            "implement": 0.35,
-            "build": 0.20,
-            "test": 0.20,
-            "commit": 0.10,
-        }
-
-        # Calculate weighted progress
-        weighted_sum = 0
-        weighted_total = 0
-
-        for category, count in self.tool_counts.items():
-            if count > 0:
-                weight = weights.get(category, 0.1)
-                # Diminishing returns for repeated tools
-                effective_count = min(count, 10)
-                weighted_sum += weight * (effective_count / 10)
-                weighted_total += weight
-
-        if weighted_total == 0:
+        if self._weighted_total == 0:
             return 25
 
         # Scale to 25-90 range
-        raw_progress = weighted_sum / weighted_total
+        raw_progress = self._weighted_sum / self._weighted_total
         return int(25 + (raw_progress * 65))
 
     def auto_update(self, tool_name: str, command: str = "", file_path: str = "") -> bool:
@@ -271,10 +614,9 @@ class KapsisStatus:
 
         # Generate message
         if file_path:
-            message = f"Working on {Path(file_path).name}"
+            message = f"Working on {_basename(file_path)}"
         elif command:
-            cmd_preview = command[:50] + "..." if len(command) > 50 else command
-            message = f"Running: {cmd_preview}"
+            message = f"Running: {command[:50]}{'...' if len(command) > 50 else ''}"
         else:
             message = f"Using {tool_name}"
 
@@ -282,13 +624,14 @@ class KapsisStatus:
 
     def _determine_phase(self) -> str:
         """Determine current phase based on tool usage patterns."""
-        if self.tool_counts["commit"] > 0:
+        counts = self.tool_counts
+        if counts[_Cat.COMMIT]:
             return "committing"
-        if self.tool_counts["test"] > 0:
+        if counts[_Cat.TEST]:
             return "testing"
-        if self.tool_counts["build"] > 0:
+        if counts[_Cat.BUILD]:
             return "building"
-        if self.tool_counts["implement"] > 0:
+        if counts[_Cat.IMPLEMENT]:
             return "implementing"
         return "exploring"
 
@@ -304,6 +647,11 @@ class KapsisStatus:
             True if update succeeded
         """
         progress = 95 if exit_code == 0 else 50
+        # Terminal status bypasses the debounce: write it immediately and
+        # drop any queued intermediate update it supersedes.
+        with self._pending_lock:
+            self._pending = None
+            self._final = True
         return self._write_status("completing", progress, message, exit_code)
 
     def fail(self, message: str = "Task failed", exit_code: int = 1) -> bool:
@@ -317,40 +665,42 @@ class KapsisStatus:
         Returns:
             True if update succeeded
         """
+        with self._pending_lock:
+            self._pending = None
+            self._final = True
         return self._write_status("completing", 50, message, exit_code or 1)
 
 
-# Singleton instance for convenience
-_default_status: Optional[KapsisStatus] = None
+# Singleton instance for convenience — constructed eagerly at import, which
+# is cheap (no I/O happens until the first write), so the convenience
+# functions below avoid a None check and an extra call frame per invocation
+_default_status = KapsisStatus()
 
 
 def get_status() -> KapsisStatus:
     """Get the default status instance."""
-    global _default_status
-    if _default_status is None:
-        _default_status = KapsisStatus()
     return _default_status
 
 
 # Convenience functions
 def update(phase: str, progress: int, message: str) -> bool:
     """Update status using default instance."""
-    return get_status().update(phase, progress, message)
+    return _default_status.update(phase, progress, message)
 
 
 def auto_update(tool_name: str, command: str = "", file_path: str = "") -> bool:
     """Auto-update status based on tool usage."""
-    return get_status().auto_update(tool_name, command, file_path)
+    return _default_status.auto_update(tool_name, command, file_path)
 
 
 def complete(message: str = "Task completed", exit_code: int = 0) -> bool:
     """Mark task as completed."""
-    return get_status().complete(message, exit_code)
+    return _default_status.complete(message, exit_code)
 
 
 def fail(message: str = "Task failed", exit_code: int = 1) -> bool:
     """Mark task as failed."""
-    return get_status().fail(message, exit_code)
+    return _default_status.fail(message, exit_code)
 
 
 if __name__ == "__main__":
@@ -36,7 +36,7 @@ get_tests_for_category() {
 echo "test-input-validation.sh test-path-spaces.sh test-dry-run-completeness.sh test-preflight-check.sh test-version-fetch.sh test-version-management.sh test-post-container-exit-code.sh test-commit-failure-handling.sh test-disk-space-guard.sh test-workspace-mount-validation.sh test-vm-health.sh test-cleanup-vm-health.sh test-cleanup-snapshots.sh test-cleanup-conversations.sh test-vfkit-watchdog.sh test-exec-channel-watchdog.sh test-config-verifier.sh test-zombie-recovery.sh test-userns-resolution.sh test-conversation-transcript.sh test-preflight-vm-memory.sh test-overlay-volume-sandbox.sh test-staging-fuse-probe.sh test-cleanup-images.sh test-kapsis-artifact-filter.sh test-ctl-packaging.sh"
             ;;
         status)
-            echo "test-status-reporting.sh test-status-hooks.sh test-host-inject-gist-hook.sh test-host-inject-all-hooks.sh test-host-claude-mock-api.sh test-host-claude-live-api.sh"
+            echo "test-status-reporting.sh test-status-hooks.sh test-status-py.sh test-host-inject-gist-hook.sh test-host-inject-all-hooks.sh test-host-claude-mock-api.sh test-host-claude-live-api.sh"
             ;;
         filesystem)
             echo "test-cow-isolation.sh test-host-unchanged.sh"
@@ -75,7 +75,7 @@ ALL_CATEGORIES="libs agent validation status filesystem maven security git clean
 
 # Quick tests (no container required)
 # These tests either don't need a container or gracefully skip container-dependent tests
-QUICK_TESTS="test-compat.sh test-logging.sh test-json-utils.sh test-git-remote-utils.sh test-agent-shortcut.sh test-agent-unknown.sh test-agent-config-override.sh test-config-resolution.sh test-input-validation.sh test-path-spaces.sh test-dry-run-completeness.sh test-status-reporting.sh test-status-hooks.sh test-preflight-check.sh test-push-verification.sh test-ssh-keychain.sh test-agent-profile-loading.sh test-agent-auth-requirements.sh test-keychain-retrieval.sh test-ssh-cache-cleanup.sh test-keychain-platform.sh test-agent-config-mounts.sh test-gradle-cache-isolation.sh test-agent-image-build.sh test-version-fetch.sh test-version-management.sh test-git-excludes.sh test-validate-staged-files.sh test-ephemeral-artifact-filtering.sh test-coauthor-fork.sh test-worktree-cleanup.sh test-config-security.sh test-post-container-exit-code.sh test-commit-failure-handling.sh test-post-container-git.sh test-network-isolation.sh test-scope-validation.sh test-sanitize-files.sh test-precommit-spellcheck.sh test-precommit-check-tests.sh test-prepush-orchestrator.sh test-containerfile.sh test-atomic-copy.sh test-snapshot-staging.sh test-ssh-config-portability.sh test-git-credential-helper.sh test-backend-abstraction.sh test-k8s-config-translation.sh test-secret-store-injection.sh test-volume-cleanup.sh test-disk-space-guard.sh test-filter-agent-config.sh test-lsp-config.sh test-plugin-path-rewrite.sh test-container-plugin-hooks.sh test-liveness-monitor.sh test-sanitized-git-objects.sh test-workspace-mount-validation.sh test-vm-health.sh test-cleanup-vm-health.sh test-cleanup-snapshots.sh test-cleanup-conversations.sh test-cleanup-status-lifecycle.sh test-podman-health.sh test-vfkit-watchdog.sh test-status-sync.sh test-secret-store.sh test-audit-patterns.sh test-config-verifier.sh test-init-git-branch.sh test-post-exit-git.sh test-zombie-recovery.sh test-userns-resolution.sh test-spec-store.sh test-conversation-transcript.sh test-host-inject-gist-hook.sh test-host-inject-all-hooks.sh test-host-claude-mock-api.sh test-container-status-hooks.sh test-container-gist-hook.sh test-container-all-hooks.sh test-preflight-vm-memory.sh test-overlay-volume-sandbox.sh test-security.sh test-gist-injection-provenance.sh test-host-strip-audit.sh test-exec-channel-watchdog.sh test-staging-fuse-probe.sh test-cleanup-images.sh test-kapsis-artifact-filter.sh test-ctl-packaging.sh"
+QUICK_TESTS="test-compat.sh test-logging.sh test-json-utils.sh test-git-remote-utils.sh test-agent-shortcut.sh test-agent-unknown.sh test-agent-config-override.sh test-config-resolution.sh test-input-validation.sh test-path-spaces.sh test-dry-run-completeness.sh test-status-reporting.sh test-status-hooks.sh test-status-py.sh test-preflight-check.sh test-push-verification.sh test-ssh-keychain.sh test-agent-profile-loading.sh test-agent-auth-requirements.sh test-keychain-retrieval.sh test-ssh-cache-cleanup.sh test-keychain-platform.sh test-agent-config-mounts.sh test-gradle-cache-isolation.sh test-agent-image-build.sh test-version-fetch.sh test-version-management.sh test-git-excludes.sh test-validate-staged-files.sh test-ephemeral-artifact-filtering.sh test-coauthor-fork.sh test-worktree-cleanup.sh test-config-security.sh test-post-container-exit-code.sh test-commit-failure-handling.sh test-post-container-git.sh test-network-isolation.sh test-scope-validation.sh test-sanitize-files.sh test-precommit-spellcheck.sh test-precommit-check-tests.sh test-prepush-orchestrator.sh test-containerfile.sh test-atomic-copy.sh test-snapshot-staging.sh test-ssh-config-portability.sh test-git-credential-helper.sh test-backend-abstraction.sh test-k8s-config-translation.sh test-secret-store-injection.sh test-volume-cleanup.sh test-disk-space-guard.sh test-filter-agent-config.sh test-lsp-config.sh test-plugin-path-rewrite.sh test-container-plugin-hooks.sh test-liveness-monitor.sh test-sanitized-git-objects.sh test-workspace-mount-validation.sh test-vm-health.sh test-cleanup-vm-health.sh test-cleanup-snapshots.sh test-cleanup-conversations.sh test-cleanup-status-lifecycle.sh test-podman-health.sh test-vfkit-watchdog.sh test-status-sync.sh test-secret-store.sh test-audit-patterns.sh test-config-verifier.sh test-init-git-branch.sh test-post-exit-git.sh test-zombie-recovery.sh test-userns-resolution.sh test-spec-store.sh test-conversation-transcript.sh test-host-inject-gist-hook.sh test-host-inject-all-hooks.sh test-host-claude-mock-api.sh test-container-status-hooks.sh test-container-gist-hook.sh test-container-all-hooks.sh test-preflight-vm-memory.sh test-overlay-volume-sandbox.sh test-security.sh test-gist-injection-provenance.sh test-host-strip-audit.sh test-exec-channel-watchdog.sh test-staging-fuse-probe.sh test-cleanup-images.sh test-kapsis-artifact-filter.sh test-ctl-packaging.sh"
 
 #===============================================================================
 # ARGUMENT PARSING
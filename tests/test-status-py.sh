@@ -0,0 +1,296 @@
+#!/usr/bin/env bash
+#===============================================================================
+# Test: Python Status Library (status.py)
+#
+# Unit tests for scripts/lib/status.py - the Python status interface for
+# custom agents. Drives the library through python3 (stdlib only).
+#
+# Tests verify:
+#   - Tool/command classification, including mvnw/gradlew wrapper builds
+#   - Incremental progress math matches the original weighted formula
+#   - Redundant writes are skipped but unchanged status still refreshes
+#     its timestamp (liveness heartbeat)
+#   - Terminal complete()/fail() status wins over debounced updates
+#   - Compact JSON by default, KAPSIS_STATUS_PRETTY=1 opt-in
+#   - KAPSIS_STATUS_MMAP=1 keeps the .json readable alongside the region
+#   - refresh_env() rebuilds the default instance
+#===============================================================================
+
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+source "$SCRIPT_DIR/lib/test-framework.sh"
+
+STATUS_PY="$KAPSIS_ROOT/scripts/lib/status.py"
+
+if ! command -v python3 &>/dev/null; then
+    log_skip "python3 not found — skipping status.py tests"
+    exit 0
+fi
+
+# Run a python snippet (stdin) against status.py with an isolated status dir.
+# The snippet gets the module preloaded as `status` via the shared prelude.
+run_status_py() {
+    local tmpdir="$1"
+    shift
+    KAPSIS_STATUS_DIR="$tmpdir" "$@" python3 - "$STATUS_PY" <<PYEOF
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("status", sys.argv[1])
+status = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(status)
+$(cat)
+PYEOF
+}
+
+#===============================================================================
+# CLASSIFICATION TESTS
+#===============================================================================
+
+test_command_classification() {
+    log_test "status.py: tool and Bash command classification"
+
+    local tmpdir rc=0
+    tmpdir=$(mktemp -d)
+    run_status_py "$tmpdir" env <<'EOF' || rc=$?
+s = status.KapsisStatus()
+C = status._Cat
+cases = [
+    ("Read", "", C.EXPLORE),
+    ("Grep", "", C.EXPLORE),
+    ("Write", "", C.IMPLEMENT),
+    ("NotebookEdit", "", C.IMPLEMENT),
+    ("Bash", "mvn clean install", C.BUILD),
+    ("Bash", "./mvnw clean install", C.BUILD),
+    ("Bash", "./gradlew build", C.BUILD),
+    ("Bash", "cmake -B build", C.BUILD),
+    ("Bash", "npm run build", C.BUILD),
+    ("Bash", "pnpm install", C.BUILD),
+    ("Bash", "pytest tests/", C.TEST),
+    ("Bash", "python -m unittest discover", C.TEST),
+    ("Bash", "ctest --output-on-failure", C.TEST),
+    ("Bash", "./run_tests.sh", C.TEST),
+    ("Bash", "go test ./...", C.TEST),
+    ("Bash", "git commit -m 'x'", C.COMMIT),
+    ("Bash", "ls -la", C.IMPLEMENT),
+    ("Bash", "git log --latest", C.IMPLEMENT),
+    ("Bash", "grep attested notes.md", C.IMPLEMENT),
+    ("WebFetch", "", C.IMPLEMENT),
+]
+for tool, cmd, want in cases:
+    got = s._map_tool_to_category(tool, cmd)
+    assert got == want, f"{tool} {cmd!r}: got {got!r}, want {want!r}"
+EOF
+    rm -rf "$tmpdir"
+
+    assert_equals "0" "$rc" "All classification cases should map to the expected category"
+}
+
+#===============================================================================
+# PROGRESS MATH TESTS
+#===============================================================================
+
+test_progress_math_matches_reference() {
+    log_test "status.py: incremental progress matches the reference formula"
+
+    local tmpdir rc=0
+    tmpdir=$(mktemp -d)
+    run_status_py "$tmpdir" env <<'EOF' || rc=$?
+import random
+
+WEIGHTS = {0: 0.15, 1: 0.35, 2: 0.20, 3: 0.20, 4: 0.10}
+
+def reference(counts):
+    """Original O(categories) formula from before the incremental rewrite."""
+    if sum(counts) == 0:
+        return 25
+    ws = wt = 0.0
+    for cat, count in enumerate(counts):
+        if count > 0:
+            w = WEIGHTS[cat]
+            ws += w * (min(count, 10) / 10)
+            wt += w
+    if wt == 0:
+        return 25
+    return int(25 + (ws / wt) * 65)
+
+tools = [("Read", ""), ("Write", ""), ("Bash", "mvn install"),
+         ("Bash", "pytest -q"), ("Bash", "git commit -m x"), ("Grep", "")]
+random.seed(7)
+for _ in range(200):
+    s = status.KapsisStatus()
+    for _ in range(random.randint(0, 40)):
+        tool, cmd = random.choice(tools)
+        s.record_tool(tool, cmd)
+    got = s.calculate_progress()
+    want = reference(s.tool_counts)
+    assert got == want, f"counts={s.tool_counts}: got {got}, want {want}"
+assert status.KapsisStatus().calculate_progress() == 25, "empty counts should be 25"
+EOF
+    rm -rf "$tmpdir"
+
+    assert_equals "0" "$rc" "Incremental math should match the reference over random sequences"
+}
+
+#===============================================================================
+# WRITE PATH TESTS
+#===============================================================================
+
+test_dedupe_skips_identical_writes() {
+    log_test "status.py: identical status is not rewritten, changed status is"
+
+    local tmpdir rc=0
+    tmpdir=$(mktemp -d)
+    run_status_py "$tmpdir" env <<'EOF' || rc=$?
+import os, time
+s = status.KapsisStatus()
+assert s._write_status("exploring", 30, "same")
+mtime1 = os.path.getmtime(str(s.status_file))
+time.sleep(0.05)
+assert s._write_status("exploring", 30, "same")
+assert os.path.getmtime(str(s.status_file)) == mtime1, "redundant write not skipped"
+assert s._write_status("exploring", 35, "same")
+assert os.path.getmtime(str(s.status_file)) > mtime1, "changed write was skipped"
+EOF
+    rm -rf "$tmpdir"
+
+    assert_equals "0" "$rc" "Dedupe should skip identical writes only"
+}
+
+test_unchanged_status_refreshes_timestamp() {
+    log_test "status.py: unchanged status still refreshes its timestamp"
+
+    local tmpdir rc=0
+    tmpdir=$(mktemp -d)
+    run_status_py "$tmpdir" env <<'EOF' || rc=$?
+import json, time
+s = status.KapsisStatus()
+assert s._write_status("implementing", 40, "steady")
+d1 = json.load(open(str(s.status_file)))
+s._last_write_time = 0  # simulate the refresh interval elapsing
+time.sleep(0.01)
+assert s._write_status("implementing", 40, "steady")
+d2 = json.load(open(str(s.status_file)))
+assert d2["timestamp"] > d1["timestamp"], "timestamp must advance for liveness"
+assert {k: v for k, v in d1.items() if k != "timestamp"} == \
+       {k: v for k, v in d2.items() if k != "timestamp"}, "only timestamp may change"
+EOF
+    rm -rf "$tmpdir"
+
+    assert_equals "0" "$rc" "Heartbeat rewrite should change only the timestamp"
+}
+
+test_terminal_status_wins_over_debounced_updates() {
+    log_test "status.py: complete() beats the debounced writer thread"
+
+    local tmpdir rc=0
+    tmpdir=$(mktemp -d)
+    run_status_py "$tmpdir" env <<'EOF' || rc=$?
+import json, time
+for trial in range(10):
+    s = status.KapsisStatus(project=f"p{trial}")
+    for i in range(50):
+        s.update("implementing", 40, f"update {i}")
+    s.complete("all done")
+    time.sleep(0.5)  # give a late daemon flush every chance to misbehave
+    d = json.load(open(str(s.status_file)))
+    assert d["phase"] == "completing", f"trial {trial}: phase {d['phase']}"
+    assert d.get("exit_code") == 0, f"trial {trial}: missing exit_code"
+EOF
+    rm -rf "$tmpdir"
+
+    assert_equals "0" "$rc" "Terminal status should never be clobbered by a late flush"
+}
+
+test_compact_default_and_pretty_env() {
+    log_test "status.py: compact JSON by default, KAPSIS_STATUS_PRETTY=1 indents"
+
+    local tmpdir rc=0
+    tmpdir=$(mktemp -d)
+    run_status_py "$tmpdir" env <<'EOF' || rc=$?
+s = status.KapsisStatus()
+s.complete("compact")
+content = open(str(s.status_file)).read()
+assert content.count("\n") == 1, f"expected single-line JSON, got {content!r}"
+EOF
+    local rc2=0
+    run_status_py "$tmpdir" env KAPSIS_STATUS_PRETTY=1 <<'EOF' || rc2=$?
+status.refresh_env()
+s = status.KapsisStatus(project="pretty")
+s.complete("pretty")
+content = open(str(s.status_file)).read()
+assert content.count("\n") > 1, f"expected indented JSON, got {content!r}"
+EOF
+    rm -rf "$tmpdir"
+
+    assert_equals "0" "$rc" "Default output should be compact"
+    assert_equals "0" "$rc2" "KAPSIS_STATUS_PRETTY=1 should indent"
+}
+
+test_mmap_mode_keeps_json_readable() {
+    log_test "status.py: KAPSIS_STATUS_MMAP=1 still serves existing .json readers"
+
+    local tmpdir rc=0
+    tmpdir=$(mktemp -d)
+    run_status_py "$tmpdir" env KAPSIS_STATUS_MMAP=1 <<'EOF' || rc=$?
+import json, os, struct
+status.refresh_env()
+s = status.KapsisStatus()
+assert s._write_status("implementing", 40, "running")
+assert os.path.exists(str(s.status_file)), ".json must exist alongside the region"
+s.complete("done")
+d = json.load(open(str(s.status_file)))
+assert d["phase"] == "completing" and d["exit_code"] == 0, d
+data = open(s._mmap_path_str, "rb").read()
+assert data[:8] == b"KAPSTAT1", "region magic missing"
+(seq,) = struct.unpack_from("<Q", data, 8)
+assert seq % 2 == 0, "sequence left odd (write in progress)"
+active, length = struct.unpack_from("<II", data, 16)
+start = status._MMAP_HEADER_SIZE + active * status._MMAP_SLOT_SIZE
+assert json.loads(data[start:start + length])["phase"] == "completing"
+EOF
+    rm -rf "$tmpdir"
+
+    assert_equals "0" "$rc" "mmap mode should keep both transports consistent"
+}
+
+#===============================================================================
+# ENVIRONMENT SNAPSHOT TESTS
+#===============================================================================
+
+test_refresh_env_rebuilds_default_instance() {
+    log_test "status.py: refresh_env() rebuilds the default instance"
+
+    local tmpdir rc=0
+    tmpdir=$(mktemp -d)
+    run_status_py "$tmpdir" env <<'EOF' || rc=$?
+import os
+assert status.get_status().project == "unknown"
+os.environ["KAPSIS_STATUS_PROJECT"] = "refreshed"
+status.refresh_env()
+assert status.get_status().project == "refreshed", status.get_status().project
+EOF
+    rm -rf "$tmpdir"
+
+    assert_equals "0" "$rc" "refresh_env should rebuild the singleton from the new env"
+}
+
+#===============================================================================
+# MAIN
+#===============================================================================
+
+main() {
+    print_test_header "Python Status Library (status.py)"
+
+    run_test test_command_classification
+    run_test test_progress_math_matches_reference
+    run_test test_dedupe_skips_identical_writes
+    run_test test_unchanged_status_refreshes_timestamp
+    run_test test_terminal_status_wins_over_debounced_updates
+    run_test test_compact_default_and_pretty_env
+    run_test test_mmap_mode_keeps_json_readable
+    run_test test_refresh_env_rebuilds_default_instance
+
+    print_summary
+}
+
+main "$@"